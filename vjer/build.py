@@ -3,7 +3,7 @@
 # Import standard modules
 from os import getenv
 from pathlib import Path
-from shutil import copyfile
+from shutil import move
 from tempfile import mkdtemp
 from typing import cast, Optional
 
@@ -16,6 +16,9 @@ from docker.errors import BuildError as DockerBuildError
 # Import project modules
 from .utils import VJER_ENV, VjerAction, VjerStep, helm
 
+_LOG_FLUSH_LINES = 64
+_LOG_FLUSH_BYTES = 8 * 1024
+
 
 class BuildStep(VjerStep):
     """This class provides build support.
@@ -35,12 +38,11 @@ class BuildStep(VjerStep):
         super().pre()
         if self.step_info.is_first_step:
             self.log_message('Preparing artifact directory', True)
-            if Path(self.project.artifacts_dir).exists():
-                self.log_message(f'Removing stale artifact directory: {self.project.artifacts_dir}')
-                rmpath(self.project.artifacts_dir)
-            if not Path(self.project.artifacts_dir).exists():
-                self.log_message(f'Creating clean artifact directory: {self.project.artifacts_dir}')
-                Path(self.project.artifacts_dir).mkdir(parents=True)
+            if (artifacts_dir := Path(self.project.artifacts_dir)).exists():
+                self.log_message(f'Removing stale artifact directory: {artifacts_dir}')
+                rmpath(artifacts_dir)
+            self.log_message(f'Creating clean artifact directory: {artifacts_dir}')
+            artifacts_dir.mkdir(parents=True)
         self.update_version_files()
 
     def post(self) -> None:
@@ -54,7 +56,7 @@ class BuildStep(VjerStep):
         self.update_version_files(reset=True)
 
     def create_archive(self, name: str, what: list, /, *, location: Optional[str] = None, arc_type: Optional[str] = None, use_tmpdir: bool = False) -> None:  # pylint: disable=too-many-arguments
-        """Helper function to create an archive. When complete, the archive is copied to the project build artifact directory.
+        """Helper function to create an archive. When complete, the archive is moved to the project build artifact directory.
 
         Args:
             name: The archive file name.
@@ -71,7 +73,8 @@ class BuildStep(VjerStep):
         try:
             self.log_message(f'Creating "{package}" archive from: {",".join(what)}', True)
             pack(package, what, item_location=location, archive_type=str(arc_type), ignore_empty=False)
-            copyfile(package, self.project.artifacts_dir / name)
+            if use_tmpdir:
+                move(package, self.project.artifacts_dir / name)
         finally:
             if use_tmpdir:
                 rmpath(package_dir)
@@ -82,21 +85,30 @@ class BuildStep(VjerStep):
         self._docker_init(push_image)
         self.log_message(f'Building docker image: {self.image_tag}', True)
         build_args = {'VERSION': self.project.version,
-                      'BUILD_VERSION': self.build.build_version} | self.step_info.build_args
+                      'BUILD_VERSION': self.build.build_version} | dict(self.step_info.build_args)
         platform_arg = {'platform': platform} if (platform := getenv('DOCKER_DEFAULT_PLATFORM', '')) else {}
         try:
             log = self.docker_client.client.images.build(rm=True, pull=True, tag=self.image_tag,
                                                          dockerfile=(self.dockerfile),
-                                                         buildargs=build_args.toDict(),
+                                                         buildargs=build_args,
                                                          path=str(self.project.project_root),
                                                          **platform_arg)[1]
             error = None
         except DockerBuildError as err:
             error = err
             log = err.build_log
+        log_buffer: list[str] = []
+        log_buffer_size = 0
         for line in log:
-            if ('stream' in line) and (line['stream'] != '\n'):
-                self.log_message(line['stream'].strip())
+            if (stream := line.get('stream')) and (stream != '\n'):
+                log_buffer.append(stream := stream.strip())
+                log_buffer_size += len(stream)
+                if (len(log_buffer) >= _LOG_FLUSH_LINES) or (log_buffer_size >= _LOG_FLUSH_BYTES):
+                    self.log_message('\n'.join(log_buffer))
+                    log_buffer.clear()
+                    log_buffer_size = 0
+        if log_buffer:
+            self.log_message('\n'.join(log_buffer))
         if error:
             raise error
         if push_image:
@@ -12,10 +12,11 @@ class DeployStep(VjerStep):
 
     def deploy_helm(self) -> None:
         """Deploy method for Helm charts."""
-        chart_name = self.step_info.chart_name if self.step_info.chart_name else self.project.name.lower()
-        release_name = self.step_info.release_name.lower() if self.step_info.release_name else chart_name
+        step_info = self.step_info
+        chart_name = step_info.chart_name if step_info.chart_name else self.project.name.lower()
+        release_name = step_info.release_name.lower() if step_info.release_name else chart_name
         helm_args = self.helm_args
-        is_remote = self.step_info.remote is not False
+        is_remote = step_info.remote is not False
         if is_remote:
             helm_chart = f'{self.helm_repo.name}/{chart_name}'
             if 'version' not in helm_args:
@@ -18,7 +18,6 @@ from tempfile import mkdtemp
 from venv import EnvBuilder
 
 # Import BatCave modules
-from batcave.fileutil import slurp, spew
 from batcave.lang import WIN32
 from batcave.sysutil import rmpath, syscmd, SysCmdRunner
 
@@ -48,10 +47,8 @@ def freeze() -> None:
     print('Installing modules from', REQUIREMENTS_FILE)
     pip('install', '-qqq', upgrade=True, requirement=REQUIREMENTS_FILE)
     print('Creating frozen requirements file:', freeze_file)
-    spew(freeze_file, pip('freeze', requirement=REQUIREMENTS_FILE))
-    freeze_file_contents = [line.strip() for line in slurp(freeze_file)]
     with open(freeze_file, 'w', encoding=DEFAULT_ENCODING) as freeze_file_stream:
-        for line in freeze_file_contents:
+        for line in (line.strip() for line in pip('freeze', requirement=REQUIREMENTS_FILE)):
             module = line.split('==')[0]
             if ('win32' in module) or (module in WINDOWS_MODULES):
                 line += "; sys_platform == 'win32'"
@@ -60,4 +57,4 @@ def freeze() -> None:
             print(line, file=freeze_file_stream)
     rmpath(venv_dir)
 
-# cSpell:ignore batcave fileutil syscmd
+# cSpell:ignore batcave syscmd
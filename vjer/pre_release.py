@@ -5,7 +5,7 @@ from typing import cast, override
 
 # Import project modules
 from .release import ReleaseStep
-from .utils import sanitize_tag, VjerAction, VjerStep
+from .utils import sanitize_tag, StepError, VjerAction, VjerStep
 
 
 class PreReleaseStep(ReleaseStep):
@@ -44,7 +44,9 @@ class PreReleaseStep(ReleaseStep):
             finally:
                 self.update_version_files(reset=True)
         else:
-            list(self.project.artifacts_dir.glob('*.tgz'))[0].rename(self.helm_package)
+            if (helm_package := next(self.project.artifacts_dir.glob(pattern := '*.tgz'), None)) is None:
+                raise StepError(StepError.ARTIFACT_NOT_FOUND, pattern=pattern, location=self.project.artifacts_dir)
+            helm_package.rename(self.helm_package)
         super().release_helm()
 
 
@@ -7,7 +7,7 @@ from typing import cast
 from batcave.sysutil import SysCmdRunner
 
 # Import project modules
-from .utils import helm, VjerAction, VjerStep
+from .utils import helm, project_config, VjerAction, VjerStep
 
 bumpver_update = SysCmdRunner('bumpver', 'update', syscmd_args={'ignore_stderr': True}).run
 
@@ -32,14 +32,16 @@ class ReleaseStep(VjerStep):
     def release_bumpver(self) -> None:
         """Perform a bumpver on release."""
         bumpver_update(**(self.step_info.args if self.step_info.args else {'tag': 'final', 'tag-commit': True}))
+        project_config.cache_clear()  # The following steps must read the new version.
 
     def release_docker(self) -> None:
         """Perform a release of a Docker image by tagging."""
         self._docker_init()
-        default_tags = [self.version_tag.lower()]
-        if not self.is_pre_release:
-            default_tags.append(f'{self.image_name}:latest'.lower())
-        self.tag_images(self.image_tag, self.step_info.tags if self.step_info.tags else default_tags)
+        if not (tags := self.step_info.tags):
+            tags = [self.version_tag.lower()]
+            if not self.is_pre_release:
+                tags.append(f'{self.image_name}:latest'.lower())
+        self.tag_images(self.image_tag, tags)
 
     def release_flit_build(self) -> None:
         """Run a Python flit build."""
@@ -55,12 +57,11 @@ class ReleaseStep(VjerStep):
 
     def release_increment_release(self) -> None:
         """Increment the project release version."""
-        if hasattr(self.project, 'version_service'):
+        if 'version_service' in self.project:
             self.log_message('Incrementing version service not supported...skipping')
             return
-        version_tuple = self.project.version.split('.')
-        version_tuple[len(version_tuple) - 1] = str(int(version_tuple[-1]) + 1)
-        new_version = '.'.join(version_tuple)
+        (version_head, separator, release_num) = self.project.version.rpartition('.')
+        new_version = f'{version_head}{separator}{int(release_num) + 1}'
         use_branch = self.step_info.increment_branch if self.step_info.increment_branch else self.git_client.CI_COMMIT_REF_NAME
         self.project.version = new_version
         self.log_message(f'Incrementing release to {new_version} on branch {use_branch}')
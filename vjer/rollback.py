@@ -12,9 +12,10 @@ class RollbackStep(VjerStep):
 
     def rollback_helm(self) -> None:
         """Rollback method for Helm charts."""
-        chart_name = self.step_info.chart_name if self.step_info.chart_name else self.project.name.lower()
+        step_info = self.step_info
+        chart_name = step_info.chart_name if step_info.chart_name else self.project.name.lower()
         helm('rollback',
-             self.step_info.release_name.lower() if self.step_info.release_name else chart_name,
+             step_info.release_name.lower() if step_info.release_name else chart_name,
              wait=True, **self.helm_args)
 
 
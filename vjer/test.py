@@ -1,20 +1,20 @@
 """This module provides test actions."""
 
 # Import standard modules
+from os import rename, scandir
+from os.path import join as path_join
 from pathlib import Path
 from sys import exit as sys_exit, stderr
 from typing import cast
 from unittest import defaultTestLoader
 
 # Import third-party-modules
-from batcave.fileutil import slurp
-from batcave.sysutil import rmpath, syscmd, SysCmdRunner
-from junitparser import JUnitXml
+from batcave.sysutil import rmpath, SysCmdRunner
 from xmlrunner import XMLTestRunner
-from yaml import full_load as yaml_load
+from yaml import load as yaml_load
 
 # Import project modules
-from .utils import DEFAULT_ENCODING, VjerAction, VjerStep, helm
+from .utils import HELM_CHART_FILE, SafeLoader, VjerAction, VjerStep, hadolint, helm
 
 
 class TestStep(VjerStep):
@@ -29,17 +29,15 @@ class TestStep(VjerStep):
         super().pre()
         if self.step_info.is_first_step:
             self.log_message('Preparing test results directory', True)
-            if Path(self.project.test_results_dir).exists():
-                self.log_message(f'Removing test results directory: {self.project.test_results_dir}')
-                rmpath(self.project.test_results_dir)
-            if not Path(self.project.test_results_dir).exists():
-                self.log_message(f'Creating clean test results directory: {self.project.test_results_dir}')
-                Path(self.project.test_results_dir).mkdir(parents=True)
+            if (test_results_dir := Path(self.project.test_results_dir)).exists():
+                self.log_message(f'Removing test results directory: {test_results_dir}')
+                rmpath(test_results_dir)
+            self.log_message(f'Creating clean test results directory: {test_results_dir}')
+            test_results_dir.mkdir(parents=True)
 
     def test_docker(self) -> None:
         """Lint method for Docker dockerfiles."""
-        dockerfile = slurp(self.dockerfile)
-        syscmd('docker', 'run', '--interactive', '--rm', 'hadolint/hadolint', input_lines=dockerfile, ignore_stderr=True)
+        hadolint(self.dockerfile)
         if self.step_info.build_test_stage:
             self.docker_build(target=self.step_info.build_test_stage)
 
@@ -49,12 +47,13 @@ class TestStep(VjerStep):
 
     def test_helm(self) -> None:
         """Lint method for Helm charts."""
-        helm('dependency', 'build', self.helm_chart_root)
-        helm('lint', self.helm_chart_root, **self.helm_args)
-        with open(self.helm_chart_root / 'Chart.yaml', encoding=DEFAULT_ENCODING) as yaml_stream:
-            helm_info = yaml_load(yaml_stream)
+        helm_chart_root = self.helm_chart_root
+        helm_args = self.helm_args
+        helm('dependency', 'build', helm_chart_root)
+        helm('lint', helm_chart_root, **helm_args)
+        helm_info = yaml_load((helm_chart_root / HELM_CHART_FILE).read_bytes(), Loader=SafeLoader)
         if helm_info['type'] != 'library':
-            helm('template', self.helm_chart_root, **self.helm_args)
+            helm('template', helm_chart_root, **helm_args)
 
     def test_mypy(self) -> None:
         """Run python mypy linter."""
@@ -66,17 +65,18 @@ class TestStep(VjerStep):
 
     def test_python_unittest(self) -> None:
         """Runs the Python unittest module framework."""
-        XMLTestRunner(output=str(self.project.test_results_dir), failfast=True, verbosity=2).run(defaultTestLoader.discover(self.project.project_root))
-        for junit_results in self.project.test_results_dir.iterdir():
-            test_suite = JUnitXml.fromfile(str(junit_results))
-            if test_suite.errors or test_suite.failures:
-                print('Unit tests failed', file=stderr)
-                sys_exit(1)
-            junit_results.rename(junit_results.parent / f'junit-{junit_results.name}')
+        test_results_dir = self.project.test_results_dir
+        if not XMLTestRunner(output=str(test_results_dir), failfast=True, verbosity=2).run(defaultTestLoader.discover(self.project.project_root)).wasSuccessful():
+            print('Unit tests failed', file=stderr)
+            sys_exit(1)
+        with scandir(test_results_dir) as dir_entries:
+            junit_results = [e for e in dir_entries if e.is_file()]
+        for junit_result in junit_results:
+            rename(junit_result.path, path_join(test_results_dir, f'junit-{junit_result.name}'))
 
 
 def test() -> None:
     """This is the main entry point."""
     VjerAction('test', cast(VjerStep, TestStep)).execute()
 
-# cSpell:ignore batcave fileutil syscmd hadolint dockerfiles vjer junitparser xmlrunner
+# cSpell:ignore batcave syscmd hadolint dockerfiles vjer xmlrunner scandir
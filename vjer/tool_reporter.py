@@ -5,13 +5,17 @@ Attributes:
 """
 
 # Import standard modules
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from itertools import chain
 from re import compile as re_compile
 
 # Import third-party modules
-from batcave.lang import CommandResult
 from batcave.sysutil import syscmd, CMDError
 from dotmap import DotMap
 
+_NOT_FOUND_ERRORS = re_compile('not found|not be found|command could not be loaded')
+
 PRODUCTS = [DotMap(name='Docker', regex=re_compile('Docker version (.+)')),
             DotMap(name='Google Cloud SDK', command='gcloud', regex=re_compile(r'Google Cloud SDK ([\d\.]+) ')),
             DotMap(name='Helm', args=['version'], regex=re_compile(r'Version:"v([\d\.]+)"'))]
@@ -26,13 +30,13 @@ def tool_reporter() -> dict:
             helm_plugins: a list of the helm plugins.
             helm_repos: a list of the helm repositories.
     """
-    tool_info = DotMap(tool_versions={})
-    for product in PRODUCTS:
-        tool_info.tool_versions[product.name] = get_version(product)
-
-    tool_info.helm_plugins = get_helm_info('plugin')
-    tool_info.helm_repos = get_helm_info('repo')
-    return tool_info.toDict()
+    with ThreadPoolExecutor(max_workers=len(PRODUCTS) + 2) as executor:
+        versions = {p.name: executor.submit(get_version, p) for p in PRODUCTS}
+        helm_plugins = executor.submit(get_helm_info, 'plugin')
+        helm_repos = executor.submit(get_helm_info, 'repo')
+        return {'tool_versions': {n: v.result() for (n, v) in versions.items()},
+                'helm_plugins': helm_plugins.result(),
+                'helm_repos': helm_repos.result()}
 
 
 def get_version(product: DotMap) -> str | list:
@@ -44,19 +48,31 @@ def get_version(product: DotMap) -> str | list:
     Returns:
         The version of the specified product.
     """
-    version_command = product.command if product.command else product.name.lower()
-    version_args = product.args if product.args else ['--version']
-    version_info: CommandResult = []
+    version_info = _get_version_info(product.command if product.command else product.name.lower(), *(product.args if product.args else ['--version']))
+    if product.raw:
+        return list(version_info)
+    return version[1] if (version := product.regex.search(' '.join(line.strip() for line in version_info))) else 'Not Found'
+
+
+@cache
+def _get_version_info(version_command: str, /, *version_args: str) -> tuple[str, ...]:
+    """Run a version command once per process.
+
+    Args:
+        version_command: The command to run.
+        *version_args: The arguments to pass to the command.
+
+    Returns:
+        The output of the command or an empty tuple if the command was not found.
+    """
     try:
-        version_info = syscmd(version_command, *version_args, ignore_stderr=True, append_stderr=True)
+        return tuple(syscmd(version_command, *version_args, ignore_stderr=True, append_stderr=True))
     except FileNotFoundError:
         pass
     except CMDError as err:
-        if not (('not found' in str(err)) or ('not be found' in str(err)) or ('command could not be loaded' in str(err))):
+        if not _NOT_FOUND_ERRORS.search(str(err)):
             raise
-    if product.raw:
-        return version_info
-    return version[1] if (version := product.regex.search(' '.join([line.strip() for line in version_info]))) else 'Not Found'
+    return ()
 
 
 def get_helm_info(info_type: str) -> dict:
@@ -70,10 +86,11 @@ def get_helm_info(info_type: str) -> dict:
     """
     helm_info = {}
     try:
-        for line in syscmd('helm', info_type, 'list', ignore_stderr=True):
-            if line.startswith('NAME'):
-                continue
-            (name, url) = line.split()[0:2]
+        helm_list = iter(syscmd('helm', info_type, 'list', ignore_stderr=True))
+        if (header := next(helm_list, None)) and not header.startswith('NAME'):
+            helm_list = chain([header], helm_list)
+        for line in helm_list:
+            (name, url) = line.split(None, 2)[0:2]
             helm_info[name] = url
     except FileNotFoundError:
         helm_info['Helm'] = 'not installed'
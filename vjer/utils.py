@@ -4,37 +4,48 @@ Attributes:
     PROJECT_CFG_FILE (str): The name of the project config file.
     TOOL_REPORT (Path): The path of the tool report.
 
-    There are several tool runners defined for simplified usage: git, helm.
+    There are several tool runners defined for simplified usage: apt, apt_install, apt_install_nosync, git, hadolint, helm, pip_install.
 """
 # Import standard modules
-from copy import deepcopy as copy_object
+from atexit import register as atexit_register
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy as shallow_copy
 from datetime import datetime
-from os import getenv
+from functools import cache, cached_property, lru_cache, partial
+from itertools import count
+from os import getenv, replace
 from pathlib import Path
 from random import randint
 from re import compile as re_compile, sub as re_sub
-from shutil import copy, copyfile, copytree
+from shutil import copy, copyfile, copytree, which
 from stat import S_IWUSR
 from string import Template
-from sys import exit as sys_exit, stderr
-from typing import Callable, cast, Optional, override
+from sys import executable, exit as sys_exit, stderr
+from tempfile import NamedTemporaryFile, gettempdir
+from typing import Any, Callable, cast, Optional, override
 
 # Import third-party modules
 from batcave.automation import Action
 from batcave.cloudmgr import Cloud, CloudType, gcloud
 from batcave.cms import Client, ClientType
 from batcave.expander import Expander, file_expander
-from batcave.lang import BatCaveError, BatCaveException, PathName, DEFAULT_ENCODING, WIN32, yaml_to_dotmap
+from batcave.fileutil import slurp
+from batcave.lang import BatCaveError, BatCaveException, CommandResult, PathName, DEFAULT_ENCODING, WIN32
 from batcave.platarch import Platform
 from batcave.sysutil import CMDError, SysCmdRunner, syscmd
 from bumpver.config import init as bumpver_config
 from dotmap import DotMap
 from flit.build import main as flit_builder
-from yaml import safe_dump as yaml_dump, safe_load as yaml_load
+from yaml import dump as yaml_dump, load as yaml_load
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
 
 # Import project modules
 from .tool_reporter import tool_reporter
 
+_EXPANSION_MARKERS = frozenset('${')
 _CONFIG_SECTIONS = ('project', 'test', 'build', 'deploy', 'rollback', 'release')
 _PROJECT_DEFAULTS = DotMap(build_artifacts='artifacts',
                            build_num_var='VJER_BUILD_NUM',
@@ -43,6 +54,11 @@ _PROJECT_DEFAULTS = DotMap(build_artifacts='artifacts',
                            dockerfile='Dockerfile',
                            test_results='test_results',
                            version_service=DotMap(type='vjer'))
+_HADOLINT_IMAGE = 'hadolint/hadolint:latest-alpine'
+_HADOLINT_LABEL = 'vjer.hadolint'
+_HADOLINT_LIFETIME = 3600  # seconds, so the container is not leaked if the process is killed before it can be removed
+_HADOLINT_RUNS = count()
+_MAX_TAG_WORKERS = 8
 _VALID_SCHEMAS = [3]
 
 PROJECT_CFG_FILE = getenv('VJER_CFG', 'vjer.yml')
@@ -59,9 +75,9 @@ REPLACER_HOLDER = '-'
 
 apt = SysCmdRunner('apt-get', '-y').run
 apt_install = SysCmdRunner('apt-get', '-y', 'install', no_install_recommends=True).run
+apt_install_nosync = SysCmdRunner('eatmydata', 'apt-get', '-y', 'install', no_install_recommends=True).run
 git = SysCmdRunner('git').run
 helm = SysCmdRunner('helm', syscmd_args={'ignore_stderr': True}).run
-pip_install = SysCmdRunner('pip', 'install', quiet=True, no_cache_dir=True, upgrade=True).run
 
 
 class ConfigurationError(BatCaveException):
@@ -81,9 +97,11 @@ class StepError(BatCaveException):
     """Step errors.
 
     Attributes:
+        ARTIFACT_NOT_FOUND: The expected build artifact was not found.
         UNKNOWN_OBJECT: The specified object is of an unknown type.
     """
     UNKNOWN_OBJECT = BatCaveError(1, Template('Unknown $type: $name'))
+    ARTIFACT_NOT_FOUND = BatCaveError(2, Template('No $pattern artifact found in: $location'))
 
 
 class Environment:  # pylint: disable=too-few-public-methods
@@ -96,6 +114,9 @@ class Environment:  # pylint: disable=too-few-public-methods
         return value
 
 
+_ENVIRONMENT = Environment()
+
+
 class GitClient(Environment):
     """Provides an interface to the Git server environment and API."""
 
@@ -124,7 +145,14 @@ class GitClient(Environment):
 
 
 class ConfigSection:
-    """Base class to manage configuration sections."""
+    """Base class to manage configuration sections.
+
+    Attributes:
+        _generation: A counter which is incremented when any section changes, since expansions may reference other sections.
+            Changes to the environment variables are not tracked, so after changing os.environ call project_config.cache_clear()
+            (or change any configuration) before reading values which expand environment variables.
+    """
+    _generation = 0
 
     def __init__(self, **defaults):
         """
@@ -134,36 +162,69 @@ class ConfigSection:
         Attributes:
             _default_property_holders: A list of property holders for defaults.
             _defaults: The configuration defaults.
+            _expand_cache: The expanded values with the generation at which they were expanded.
             _expander: The expander to use for variable replacement.
             _values: The configuration values.
         """
+        self._expand_cache: dict = {}
         self._values = DotMap()
         self._defaults = DotMap(**defaults)
-        self._default_property_holders = [Environment()]
+        self._default_property_holders = [_ENVIRONMENT]
         self._expander = None
         self.update_expander(property_holders=self._default_property_holders)
 
+    def __contains__(self, attr: str) -> bool:
+        return (attr in self._values) or (attr in self._defaults)
+
     def __getattr__(self, attr: str):
+        if (cached := self._expand_cache.get(attr)) and (cached[0] == ConfigSection._generation):
+            value = cached[1]
+        else:
+            value = self._expand(attr)
+            self._expand_cache[attr] = (ConfigSection._generation, value)
+        return value.copy() if isinstance(value, (list, dict)) else value
+
+    def __setattr__(self, attr: str, value: str):
+        if attr.startswith('_'):
+            super().__setattr__(attr, value)
+            return
+        setattr(self._values, attr, value)
+        ConfigSection._generation += 1
+
+    def _expand(self, attr: str) -> Any:
         for config in (self._values, self._defaults):
             if attr in config:
                 value = getattr(config, attr)
                 if isinstance(value, list):
-                    return [self._expander.expand(v) for v in value]
+                    return [self._expand_value(v) for v in value]
                 if isinstance(value, dict):
-                    return DotMap({k: self._expander.expand(v) for (k, v) in value.items()})
+                    return DotMap({k: self._expand_value(v) for (k, v) in value.items()})
                 if isinstance(value, str):
-                    return self._expander.expand(value)
+                    return self._expand_value(value)
                 return value
         raise AttributeError(f'No configuration value found: {attr}')
 
-    def __setattr__(self, attr: str, value: str):
-        if attr.startswith('_'):
-            super().__setattr__(attr, value)
-            return
-        setattr(self._values, attr, value)
+    def _expand_value(self, value: Any) -> Any:
+        if isinstance(value, str) and _EXPANSION_MARKERS.isdisjoint(value):
+            return value
+        return self._expander.expand(value)
 
     values = property(lambda s: s._values.toDict(), doc='A read-only property which returns the configuration values.')
 
+    def copy(self) -> 'ConfigSection':  # pylint: disable=protected-access
+        """Create a copy of the configuration section which can be modified without affecting this one.
+
+        Returns:
+            The copy of the configuration section.
+        """
+        section_copy = ConfigSection.__new__(ConfigSection)
+        section_copy._expand_cache = {}
+        section_copy._values = self._values.copy()
+        section_copy._defaults = self._defaults.copy()
+        section_copy._default_property_holders = self._default_property_holders
+        section_copy._expander = self._expander
+        return section_copy
+
     def update_expander(self, *, property_holders: Optional[list] = None, property_dict: Optional[dict] = None) -> None:
         """Set the expander property holders.
 
@@ -175,9 +236,11 @@ class ConfigSection:
             Nothing.
         """
         if property_holders:
-            self._expander = Expander(var_props=property_holders + self._default_property_holders)
+            self._expander = _get_expander(tuple(property_holders + self._default_property_holders))
         if property_dict:
-            self._expander.var_dict |= property_dict
+            self._expander = shallow_copy(self._expander)  # The expander may be shared with other sections.
+            self._expander.var_dict = self._expander.var_dict | property_dict
+        ConfigSection._generation += 1
 
     def update(self, values: dict | DotMap, /) -> None:
         """Update the configuration section values.
@@ -189,6 +252,7 @@ class ConfigSection:
             Nothing.
         """
         self._values |= values
+        ConfigSection._generation += 1
 
     def update_defaults(self, values: dict | DotMap, /) -> None:
         """Updates the configuration section default values.
@@ -200,6 +264,7 @@ class ConfigSection:
             Nothing.
         """
         self._defaults |= values
+        ConfigSection._generation += 1
 
 
 class ProjectConfig:
@@ -213,7 +278,7 @@ class ProjectConfig:
             schema: The schema version of the project configuration.
         """
         project_root = Path.cwd()
-        self._sections = {'project': ConfigSection(**(DotMap(project_root=project_root) | _PROJECT_DEFAULTS)),
+        self._sections = {'project': ConfigSection(project_root=project_root, **_PROJECT_DEFAULTS),
                           'test': ConfigSection(),
                           'deploy': ConfigSection(clean=True),
                           'rollback': ConfigSection(clean=True),
@@ -227,15 +292,17 @@ class ProjectConfig:
         self._load_config()
         self._set_defaults()
         self._set_version()
-
-        for section in _CONFIG_SECTIONS:
-            self._sections[section].update_expander(property_holders=list(self._sections.values()))
+        self._update_expanders()
 
     def __getattr__(self, attr: str):
         if attr not in self._sections:
             raise AttributeError(f'Configuration section not found: {attr}')
         return self._sections[attr]
 
+    def _update_expanders(self) -> None:
+        for section in _CONFIG_SECTIONS:
+            self._sections[section].update_expander(property_holders=list(self._sections.values()))
+
     def _get_phase_step(self, phase: str, step_type: str) -> DotMap:
         """Get the specified step type for the specified phase.
 
@@ -246,26 +313,24 @@ class ProjectConfig:
         Returns:
             A DotMap for the step.
         """
-        if hasattr(phase_ref := getattr(self, phase), 'steps'):
+        if 'steps' in (phase_ref := getattr(self, phase)):
             for step in phase_ref.steps:
                 if step.get('type') == step_type:
-                    return copy_object(step)
+                    return DotMap(step)
         return DotMap(type=step_type)
 
     def _load_config(self) -> None:
         if not self._config_file.exists():
             raise ConfigurationError(ConfigurationError.CONFIG_FILE_NOT_FOUND, file=self._config_file)
-        yaml_as_dict = DotMap(schema=0)
-        with open(self._config_file, encoding=DEFAULT_ENCODING) as config_file:
-            yaml_as_dict |= DotMap(yaml_load(config_file))
-        if not yaml_as_dict:
+        yaml_as_dict = yaml_load(self._config_file.read_bytes(), Loader=SafeLoader)
+        if not (yaml_as_dict and isinstance(yaml_as_dict, dict)):
             raise ConfigurationError(ConfigurationError.BAD_FORMAT, file=self._config_file)
-        if yaml_as_dict.schema not in _VALID_SCHEMAS:
-            raise ConfigurationError(ConfigurationError.INVALID_SCHEMA, found=yaml_as_dict.schema, expected=_VALID_SCHEMAS)
-        self.schema = yaml_as_dict.schema
+        if (schema := yaml_as_dict.get('schema', 0)) not in _VALID_SCHEMAS:
+            raise ConfigurationError(ConfigurationError.INVALID_SCHEMA, found=schema, expected=_VALID_SCHEMAS)
+        self.schema = schema
         for section in _CONFIG_SECTIONS:
             if section in yaml_as_dict:
-                self._sections[section].update(yaml_as_dict[section])
+                self._sections[section].update(DotMap(yaml_as_dict[section]))
 
     def _set_defaults(self) -> None:
         self.project.update_defaults(DotMap(artifacts_dir=self.project.project_root / self.project.build_artifacts,
@@ -289,11 +354,24 @@ class ProjectConfig:
                                           build_version_msbuild=f'{self.project.version}.{build_num}',
                                           build_name=f'{self.project.name}_{build_version}'))
         self.release.update_defaults(DotMap(release_tag=f'v{self.project.version}'))
-        for (piece, index) in {'major': 0, 'minor': 1, 'patch': 2}.items():
-            self.project.update_defaults({f'{piece}': self.project.version.split('.', 2)[index]})
+        version_parts = str(self.project.version).split('.', 2) + ['0', '0']
+        self.project.update_defaults({'major': version_parts[0], 'minor': version_parts[1], 'patch': version_parts[2]})
 
     filename = property(lambda s: s._config_file, doc='A read-only property which returns the configuration file name.')
 
+    def copy(self) -> 'ProjectConfig':  # pylint: disable=protected-access
+        """Create a copy of the project configuration which can be modified without affecting this one.
+
+        Returns:
+            The copy of the project configuration.
+        """
+        config_copy = ProjectConfig.__new__(ProjectConfig)
+        config_copy._sections = {n: s.copy() for (n, s) in self._sections.items()}
+        config_copy._config_file = self._config_file
+        config_copy.schema = self.schema
+        config_copy._update_expanders()
+        return config_copy
+
     def write(self) -> None:
         """Writes out the project configuration.
 
@@ -302,7 +380,8 @@ class ProjectConfig:
         """
         with open(self._config_file, 'w', encoding=DEFAULT_ENCODING) as config_file:
             yaml_dump({'schema': self.schema} | {s: c.values for (s, c) in self._sections.items() if c.values},
-                      config_file, indent=2)
+                      config_file, Dumper=SafeDumper, indent=2)
+        project_config.cache_clear()
 
 
 class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
@@ -325,7 +404,7 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
             version_tag: The Docker image version.
         """
         super().__init__()
-        self.config = ProjectConfig()
+        self.config = project_config().copy()
         self.project = self.config.project
         self.build = self.config.build
         self.release = self.config.release
@@ -340,7 +419,7 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
         self.image_tag = ''
 
     def __getattr__(self, attr: str):
-        if not hasattr(self.project, attr):
+        if attr not in self.project:
             raise AttributeError(f'No such attribute: {attr}')
         return getattr(self.step_info, attr) if getattr(self.step_info, attr) else getattr(self.project, attr)
 
@@ -376,14 +455,15 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
     pkg_name = property(lambda s: f'{s.step_info.pkg_name if s.step_info.pkg_name else s.project.name}-{s.project.version}',
                         doc='A read-only property which returns the release package name.')
 
-    @property
+    @cached_property
     def helm_args(self) -> dict:
-        """A read-only property which returns the Helm command arguments."""
+        """A read-only property which returns the Helm command arguments, computed once per step."""
         helm_args = self.step_info.helm_args if self.step_info.helm_args else {}
         if self.step_info.values_files:
-            helm_args['values'] = ','.join([str(self.project.artifacts_dir / v) for v in self.step_info.values_files])
+            artifacts_dir = self.project.artifacts_dir
+            helm_args['values'] = ','.join(str(artifacts_dir / v) for v in self.step_info.values_files)
         if self.step_info.helm_variables:
-            helm_args['set'] = ','.join([f'{k}={v}' for (k, v) in self.step_info.helm_variables.items()])
+            helm_args['set'] = ','.join(f'{k}={v}' for (k, v) in self.step_info.helm_variables.items())
         return helm_args
 
     @property
@@ -460,21 +540,38 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
         Returns:
             Nothing.
         """
-        if (registry := self.project.container_registry).type not in ('gcp', 'gcp-art'):
+        image = None
+        if (registry_type := self.project.container_registry.type) not in ('gcp', 'gcp-art'):
             (image := self.registry_client.get_image(source_tag)).pull()
-        for tag in tags:
-            (repo, candidate_tag) = tag.split(':', 1) if (':' in tag) else ('', tag)
-            sanitized_tag = sanitize_tag(candidate_tag)
-            final_tag = f'{repo}:{sanitized_tag}' if (':' in tag) else sanitized_tag
-            self.log_message(f'Tagging image: {final_tag}')
-            match registry.type:
-                case 'gcp':
-                    gcloud('container', 'images', 'add-tag', source_tag, final_tag, syscmd_args={'ignore_stderr': True})
-                case 'gcp-art':
-                    gcloud('artifacts', 'docker', 'tags', 'add', source_tag, final_tag, syscmd_args={'ignore_stderr': True})
-                case  _:
-                    image.tag(final_tag)
-                    image.push()
+        if not tags:
+            return
+        with ThreadPoolExecutor(max_workers=min(_MAX_TAG_WORKERS, len(tags))) as executor:
+            list(executor.map(partial(self._tag_image, registry_type, source_tag, image), tags))
+
+    def _tag_image(self, registry_type: str, source_tag: str, image: Any, tag: str) -> None:
+        """Add a single tag to a Docker image.
+
+        Args:
+            registry_type: The type of the container registry.
+            source_tag: The tag of the existing image to which to add the new tag.
+            image: The pulled image to tag for registries not managed by gcloud.
+            tag: The tag to add.
+
+        Returns:
+            Nothing.
+        """
+        (repo, candidate_tag) = tag.split(':', 1) if (':' in tag) else ('', tag)
+        sanitized_tag = sanitize_tag(candidate_tag)
+        final_tag = f'{repo}:{sanitized_tag}' if (':' in tag) else sanitized_tag
+        self.log_message(f'Tagging image: {final_tag}')
+        match registry_type:
+            case 'gcp':
+                gcloud('container', 'images', 'add-tag', source_tag, final_tag, syscmd_args={'ignore_stderr': True})
+            case 'gcp-art':
+                gcloud('artifacts', 'docker', 'tags', 'add', source_tag, final_tag, syscmd_args={'ignore_stderr': True})
+            case  _:
+                image.tag(final_tag)
+                image.push()
 
     def tag_source(self, tag: str, label: Optional[str] = None) -> None:
         """Tag the source in Git.
@@ -517,14 +614,14 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
                 prefix = Path('.')
 
         if self.step_info.type in DEFAULT_VERSION_FILES:
-            self.step_info.version_files += [prefix / v for v in DEFAULT_VERSION_FILES[self.step_info.type] if (prefix / v).exists()]
+            self.step_info.version_files += [p for p in (prefix / v for v in DEFAULT_VERSION_FILES[self.step_info.type]) if p.exists()]
 
         if not self.step_info.version_files:
             return
 
         self.log_message(f'{verb} version files', True)
         for file_name in self.step_info.version_files:
-            file_path = Path(file_name)
+            file_path = file_name if isinstance(file_name, Path) else Path(file_name)
             msg = f'{verb}: {file_path}'
             file_orig = Path(str(file_path) + '.orig')
             if reset:
@@ -535,17 +632,20 @@ class VjerStep(Action):  # pylint: disable=too-many-instance-attributes
                     file_orig.rename(file_path)
             else:
                 self.log_message(msg)
-                file_path.chmod(file_path.stat().st_mode | S_IWUSR)
+                file_mode = file_path.stat().st_mode
+                if not file_mode & S_IWUSR:
+                    file_path.chmod(file_mode | S_IWUSR)
                 copyfile(file_path, file_orig)
-                file_expander(file_orig, file_path, var_props=(self.project, self.build, self.step_info))
-                if file_path.name == HELM_CHART_FILE:
-                    with open(file_path, encoding=DEFAULT_ENCODING) as yaml_stream:
-                        helm_info = yaml_load(yaml_stream)
+                var_props = (self.project, self.build, self.step_info)
+                if file_path.name != HELM_CHART_FILE:
+                    file_expander(file_orig, file_path, var_props=var_props)
+                else:
+                    helm_info = yaml_load(Expander(var_props=var_props).expand(file_orig.read_text(encoding=DEFAULT_ENCODING)), Loader=SafeLoader)
                     helm_info['version'] = self.project.version
                     if self.step_info.set_app_version:
                         helm_info['appVersion'] = self.project.version
                     with open(file_path, 'w', encoding=DEFAULT_ENCODING) as yaml_stream:
-                        yaml_dump(helm_info, yaml_stream)
+                        yaml_dump(helm_info, yaml_stream, Dumper=SafeDumper)
 
 
 class VjerAction:  # pylint: disable=too-few-public-methods
@@ -561,28 +661,183 @@ class VjerAction:  # pylint: disable=too-few-public-methods
             action_type: The value of the action_type argument.
             config: The project configuration.
         """
-        self.config = ProjectConfig()
+        self.config = project_config().copy()
         self.action_type = action_type
         self.action_step_class = action_step_class
 
     def execute(self) -> None:
         """Run the action."""
-        for (category, info) in (yaml_to_dotmap(TOOL_REPORT) if TOOL_REPORT.exists() else tool_reporter()).items():
-            VjerStep().log_message(category.replace('_', ' ').title(), True)
+        if TOOL_REPORT.exists():
+            report = yaml_load(TOOL_REPORT.read_bytes(), Loader=SafeLoader)
+        elif (job_report := _job_tool_report()) and job_report.exists():
+            report = yaml_load(job_report.read_bytes(), Loader=SafeLoader)
+        else:
+            report = tool_reporter()
+            if job_report:
+                _write_tool_report(report, job_report)
+        for (category, info) in report.items():
+            log_message(category.replace('_', ' ').title(), True)
             for (name, data) in info.items():
-                VjerStep().log_message(f'  {name}: {data}')
-        if not hasattr(action_def := getattr(self.config, self.action_type), 'steps'):
+                log_message(f'  {name}: {data}')
+        if 'steps' not in (action_def := getattr(self.config, self.action_type)):
             return
 
         is_first_step = True
         for step in [DotMap(s) for s in action_def.steps]:
             step.is_first_step = is_first_step
-            VjerStep().log_message(f'Executing {self.action_type} step: {step.type if (not step.name) else step.name}', True)
+            log_message(f'Executing {self.action_type} step: {step.type if (not step.name) else step.name}', True)
             (executor := cast(Callable, self.action_step_class)()).step_info = step
             executor.execute()
             is_first_step = False
 
 
+class _MessageLogger(Action):  # pylint: disable=too-few-public-methods
+    """This class provides the action message formatting for messages logged outside of a step."""
+    @override
+    def _execute(self) -> None:
+        """This class is only used for logging and is never executed."""
+
+
+@cache
+def _hadolint_server() -> str:
+    """Start a labeled hadolint container with a bounded lifetime which is removed when the process exits.
+
+    Returns:
+        The ID of the container.
+    """
+    container_id = [line.strip() for line in syscmd('docker', 'run', '--detach', '--rm', '--label', _HADOLINT_LABEL, '--entrypoint', 'sleep',
+                                                    _HADOLINT_IMAGE, str(_HADOLINT_LIFETIME), ignore_stderr=True)
+                    if line.strip()][-1]
+    atexit_register(_remove_container, container_id)
+    return container_id
+
+
+def _remove_container(container_id: str, /) -> None:
+    """Remove a Docker container, ignoring a container which is already gone.
+
+    Args:
+        container_id: The ID of the container to remove.
+
+    Returns:
+        Nothing.
+    """
+    try:
+        syscmd('docker', 'rm', '--force', container_id, ignore_stderr=True)
+    except CMDError:
+        pass
+
+
+@lru_cache(maxsize=32)
+def _get_expander(property_holders: tuple, /) -> Expander:
+    """Get an expander for the property holders, sharing it between the sections which use the same holders.
+
+    Args:
+        property_holders: The property holders from which the expander reads values.
+
+    Returns:
+        The expander.
+    """
+    return Expander(var_props=list(property_holders))
+
+
+def log_message(message: str, guard: bool = False, /) -> None:
+    """Log a message in the same format as an action step without constructing a step.
+
+    Args:
+        message: The message to log.
+        guard (optional, default=False): If True, surround the message with guard lines.
+
+    Returns:
+        Nothing.
+    """
+    _message_logger().log_message(message, guard)
+
+
+@cache
+def _message_logger() -> Action:
+    return _MessageLogger()
+
+
+@cache
+def project_config() -> ProjectConfig:
+    """Load the project configuration once per process.
+
+    Returns:
+        The shared project configuration. Use its copy() method to get a configuration which can be modified.
+    """
+    return ProjectConfig()
+
+
+@cache
+def _pip_installer() -> Callable[..., CommandResult]:
+    """Select the Python package installer, preferring uv when it is available.
+
+    Returns:
+        The run method of the installer.
+    """
+    if which('uv'):
+        return SysCmdRunner('uv', 'pip', 'install', quiet=True, upgrade=True, python=executable).run
+    return SysCmdRunner(executable, '-m', 'pip', 'install', quiet=True, prefer_binary=True, upgrade=True).run
+
+
+def pip_install(*args, **kwargs) -> CommandResult:
+    """Install Python packages with uv if it is available or pip if not.
+
+    Args:
+        *args: The packages to install.
+        **kwargs: The options to pass to the installer.
+
+    Returns:
+        The output of the installer.
+    """
+    return _pip_installer()(*args, **kwargs)
+
+
+def _job_tool_report() -> Optional[Path]:
+    """Determine where the tool report for the current CI job is saved.
+
+    Returns:
+        The path of the job tool report, or None if not running in a CI job.
+    """
+    job_id = getenv('CI_JOB_ID') or '-'.join(i for i in (getenv('GITHUB_RUN_ID'), getenv('GITHUB_RUN_ATTEMPT'), getenv('GITHUB_JOB')) if i)
+    return (Path(gettempdir()) / f'vjer-tool-report-{job_id}.yml') if job_id else None
+
+
+def _write_tool_report(report: dict, report_path: Path, /) -> None:
+    """Save the tool report so that later actions in the same job can read it instead of running the tools again.
+
+    Args:
+        report: The tool report to save.
+        report_path: The path to which to save the report.
+
+    Returns:
+        Nothing.
+    """
+    report_file = None
+    try:
+        with NamedTemporaryFile('w', encoding=DEFAULT_ENCODING, dir=report_path.parent, suffix='.tmp', delete=False) as report_stream:
+            report_file = Path(report_stream.name)
+            yaml_dump(report, report_stream, Dumper=SafeDumper, sort_keys=False)
+        replace(report_file, report_path)
+    except OSError:
+        if report_file:
+            report_file.unlink(missing_ok=True)
+
+
+def hadolint(dockerfile: PathName, /) -> CommandResult:
+    """Lint a Dockerfile with hadolint, reusing a single container for the calls after the first one in the process.
+
+    Args:
+        dockerfile: The Dockerfile to lint.
+
+    Returns:
+        The output of hadolint.
+    """
+    if not next(_HADOLINT_RUNS):  # Most processes only lint once so a single run is cheaper than starting a container.
+        return syscmd('docker', 'run', '--interactive', '--rm', _HADOLINT_IMAGE, input_lines=slurp(dockerfile), ignore_stderr=True)
+    return syscmd('docker', 'exec', '--interactive', _hadolint_server(), 'hadolint', '-', input_lines=slurp(dockerfile), ignore_stderr=True)
+
+
 def sanitize_tag(tag: str, replacement_char: str = '-') -> str:
     """Sanitize a Docker tag by replacing invalid characters with a specified valid character.
 
@@ -602,4 +857,4 @@ def sanitize_tag(tag: str, replacement_char: str = '-') -> str:
         raise ValueError(f"The sanitized tag '{sanitized_tag}' is still not valid according to Docker's specifications.")
     return sanitized_tag
 
-# cSpell:ignore batcave bumpver cloudmgr dotmap platarch syscmd vjer checkin
+# cSpell:ignore eatmydata nosync batcave bumpver cloudmgr dotmap fileutil hadolint platarch syscmd vjer checkin
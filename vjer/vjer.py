@@ -4,53 +4,76 @@ Since this program can be called before the requirements are install, it can onl
 """
 
 # Import standard modules
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
 from importlib import import_module
+from importlib.util import find_spec
 import os
 from os import getenv
 from pathlib import Path
 from platform import platform, system
-from sys import exit as sys_exit, stderr, version as python_version
+from shutil import which
+from sys import executable as python_executable, exit as sys_exit, prefix as python_prefix, stderr, version as python_version
+from tomllib import load as toml_load
+from typing import Callable
 
 # Import third-party modules
 from batcave.commander import Argument, Commander
-from batcave.fileutil import slurp
 from batcave.sysutil import SysCmdRunner
 from batcave.version import AppVersion, VersionStyle
-from flit.install import Installer
 
 # Import local modules
 from . import __title__, __version__, __build_name__, __build_date__
-from .utils import apt, apt_install, VJER_ENV, pip_install, ProjectConfig, ConfigurationError, PROJECT_CFG_FILE, VjerStep
+from .utils import apt, apt_install, apt_install_nosync, VJER_ENV, pip_install, project_config, ConfigurationError, PROJECT_CFG_FILE, log_message
 
 ACTIONS = ['test', 'build', 'deploy', 'rollback', 'pre_release', 'release', 'freeze']
+_DISPATCH: dict[str, Callable[[], None]] = {}
+_INIT_VARS = ('VJER_PKG_INSTALLS', 'VJER_PIP_INSTALLS', 'VJER_PIP_INSTALL_FILE', 'VJER_USE_FLIT')
 
 
 def main() -> None:
     """The main entrypoint."""
     version = AppVersion(__title__, __version__, __build_date__, __build_name__)
-    args = Commander('Vjer CI/CD Automation Tool', [Argument('actions', choices=ACTIONS, nargs='+')], version=version).parse_args()
-    VjerStep().log_message(version.get_info(VersionStyle.one_line), True)
+    args = Commander('Vjer CI/CD Automation Tool',
+                     [Argument('actions', choices=ACTIONS, nargs='+'),
+                      Argument('-q', '--quiet', action='store_true', help='Do not report the operating system and Python details.')],
+                     version=version).parse_args()
+    log_message(version.get_info(VersionStyle.one_line), True)
     _setup_environment()
-    VjerStep().log_message(f'OS: {platform()}')
-    if (system() == 'Linux') and (release_file := Path('/etc/os-release')).exists():
-        for line in slurp(release_file):
-            VjerStep().log_message(line.strip())
-    VjerStep().log_message(f'Python version: {python_version}')
+    if not args.quiet:
+        log_message(f'OS: {platform()}')
+        if (system() == 'Linux') and (release_file := Path('/etc/os-release')).exists():
+            log_message(release_file.read_bytes().decode(errors='replace').strip())
+        log_message(f'Python version: {python_version}')
 
     _sys_initialize()
     for action in args.actions:
-        action_module = import_module(f'vjer.{action}')
-        action_module.__dict__[action]()
+        _get_action(action)()
+
+
+def _get_action(action: str) -> Callable[[], None]:
+    if (action_function := _DISPATCH.get(action)) is None:
+        action_function = _DISPATCH[action] = getattr(import_module(f'vjer.{action}'), action)
+    return action_function
+
+
+def _apt_setup(pkg_installs: str) -> None:
+    apt('update')
+    installer = apt_install
+    if getenv('VJER_EATMYDATA', ''):
+        if not which('eatmydata'):
+            apt_install('eatmydata')
+        installer = apt_install_nosync
+    installer(*dict.fromkeys(pkg_installs.split()))
 
 
 def _pip_setup() -> None:
-    SysCmdRunner('python', '-m', 'pip', 'install', 'pip', quiet=True, no_cache_dir=True, upgrade=True).run()
-    pip_install('setuptools', 'wheel')
+    SysCmdRunner(python_executable, '-m', 'pip', 'install', 'pip', 'setuptools', 'wheel', quiet=True, prefer_binary=True, upgrade=True).run()
 
 
 def _setup_environment() -> None:
     try:
-        config = ProjectConfig()
+        config = project_config()
     except ConfigurationError as err:
         if err.code != ConfigurationError.CONFIG_FILE_NOT_FOUND.code:
             raise
@@ -59,28 +82,77 @@ def _setup_environment() -> None:
     if (VJER_ENV == 'local') and not getenv('VIRTUAL_ENV', ''):
         print('ERROR Vjer must be run from a virtual environment.', file=stderr)
         sys_exit(1)
-    if hasattr((config := ProjectConfig()).project, 'environment'):
-        for (var, val) in config.project.environment.items():
-            VjerStep().log_message(f'setting {var}={val}')
-            os.environ[var] = val  # putenv doesn't work because the values are needed for this process.
+    if 'environment' in config.project:
+        environment = {var: str(val) for (var, val) in config.project.environment.items()}
+        for (var, val) in environment.items():
+            log_message(f'setting {var}={val}')
+        os.environ.update(environment)  # putenv doesn't work because the values are needed for this process.
+        project_config.cache_clear()  # The configuration may expand the new values.
 
 
 def _sys_initialize() -> None:
-    if pkg_installs := getenv('VJER_PKG_INSTALLS', ''):
-        apt('update')
-        apt_install(pkg_installs)
-
-    if (pip_installs := getenv('VJER_PIP_INSTALLS', '')) or (pip_file := getenv('VJER_PIP_INSTALL_FILE', '')) or (use_flit := getenv('VJER_USE_FLIT', '')):
-        _pip_setup()
-        if pip_installs:
-            pip_install(pip_installs)
-        if pip_file:
-            pip_install(requirement=pip_file)
-        if use_flit:
-            Installer.from_ini_path(Path('pyproject.toml')).install()
+    if not any(getenv(v, '') for v in _INIT_VARS):
+        return
+    pip_cache = getenv('VJER_PIP_CACHE', str(Path.home() / '.cache' / 'vjer-pip'))
+    os.environ.setdefault('PIP_CACHE_DIR', pip_cache)
+    os.environ.setdefault('UV_CACHE_DIR', str(Path(pip_cache) / 'uv'))  # Keep uv cache maintenance away from the pip cache.
+    # The marker is kept with the Python environment so it only covers the Python requirements.
+    # The system packages are always installed since the environment may have been restored into a fresh system.
+    if pip_installed := (init_marker := _sys_initialize_marker()).exists():
+        log_message(f'Python requirements already installed: {init_marker}')
+    _install_requirements(pip_installed)
+    if not pip_installed:
+        try:
+            init_marker.touch()
+        except OSError:
+            pass  # Without the marker the requirements are installed again on the next run.
+
+    # The project itself is always installed since its source may have changed since the last run.
+    if (use_flit := getenv('VJER_USE_FLIT', '')) == 'strict':
+        from flit.install import Installer  # pylint: disable=import-outside-toplevel
+        Installer.from_ini_path(Path('pyproject.toml')).install()
+    elif use_flit:
+        # Install all the extras to match the flit installer, which defaults to installing all the optional dependencies.
+        pip_install(f'.[{",".join(extras)}]' if (extras := _project_extras()) else '.')
+
+
+def _install_requirements(pip_installed: bool, /) -> None:
+    pkg_installs = getenv('VJER_PKG_INSTALLS', '')
+    pip_installs = '' if pip_installed else getenv('VJER_PIP_INSTALLS', '')
+    pip_file = '' if pip_installed else getenv('VJER_PIP_INSTALL_FILE', '')
+    use_flit = '' if pip_installed else getenv('VJER_USE_FLIT', '')
+
+    # The pip bootstrap can overlap the apt work only if this interpreter already has pip, otherwise pip may come from the system packages.
+    # The requirement installs may need to build against the system packages so they always wait for apt.
+    needs_pip = bool(pip_installs or pip_file or use_flit)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pip_setup = executor.submit(_pip_setup) if (needs_pip and find_spec('pip')) else None
+        if pkg_installs:
+            _apt_setup(pkg_installs)
+        if pip_setup:
+            pip_setup.result()
+        elif needs_pip:
+            _pip_setup()
+
+    if pip_installs:
+        pip_install(*dict.fromkeys(pip_installs.split()))
+    if pip_file:
+        pip_install(requirement=pip_file)
+
+
+def _project_extras() -> list[str]:
+    with open('pyproject.toml', 'rb') as pyproject_file:
+        return list(toml_load(pyproject_file).get('project', {}).get('optional-dependencies', {}))
+
+
+def _sys_initialize_marker() -> Path:
+    fingerprint = sha256('|'.join([python_executable] + [getenv(v, '') for v in _INIT_VARS if v != 'VJER_PKG_INSTALLS']).encode())
+    if (pip_file := getenv('VJER_PIP_INSTALL_FILE', '')) and (pip_file_path := Path(pip_file)).exists():
+        fingerprint.update(pip_file_path.read_bytes())
+    return Path(python_prefix) / f'.vjer-init-{fingerprint.hexdigest()}'  # Removed along with the environment.
 
 
 if __name__ == '__main__':
     main()
 
-# cSpell:ignore batcave vjer fileutil syscmd putenv
+# cSpell:ignore batcave eatmydata nosync vjer syscmd putenv